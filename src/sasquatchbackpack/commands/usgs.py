@@ -1,72 +1,68 @@
 """USGS CLI."""
 
 from datetime import timedelta
+from typing import Final
 
 import click
 
-from sasquatchbackpack import sasquatch
-from sasquatchbackpack.scripts import usgs
+DEFAULT_RADIUS: Final = 400
 
-DEFAULT_RADIUS = 400
+DEFAULT_COORDS: Final = (-30.22573200864174, -70.73932987127506)
 
-DEFAULT_COORDS = (-30.22573200864174, -70.73932987127506)
+DEFAULT_MAGNITUDE_BOUNDS: Final = (2, 10)
 
-DEFAULT_MAGNITUDE_BOUNDS = (2, 10)
+MAX_DURATION: Final = timedelta(days=10000)
+
+MIN_DURATION: Final = timedelta(hours=1)
+
+COORDS_BOUNDS: Final = (("latitude", -90, 90), ("longitude", -180, 180))
+
+MAGNITUDE_BOUNDS: Final = (
+    ("minimum magnitude", 0, 10),
+    ("maximum magnitude", 0, 10),
+)
 
 
 def check_duration(
     ctx: click.Context, param: dict, value: tuple[int, int]
-) -> tuple[int, int]:
-    """Validate duration inputs."""
+) -> timedelta:
+    """Validate duration inputs and convert them to a `datetime.timedelta`."""
     days, hours = value
     total_duration = timedelta(days=days, hours=hours)
 
-    if total_duration > timedelta(days=10000):
+    if total_duration > MAX_DURATION:
         raise click.BadParameter(
-            f"""Your provided duration ({total_duration!s}) is
-    too large. The maximum is 10000 days."""
+            f"Your provided duration ({total_duration!s}) is too large. "
+            "The maximum is 10000 days."
         )
-    if total_duration < timedelta(hours=1):
+    if total_duration < MIN_DURATION:
         raise click.BadParameter(
-            f"""Your provided duration ({total_duration!s}) is
-    too small. The minimum is 1 hour."""
+            f"Your provided duration ({total_duration!s}) is too small. "
+            "The minimum is 1 hour."
         )
 
-    return value
-
+    return total_duration
 
-def check_radius(ctx: click.Context, param: dict, value: int) -> int:
-    """Validate radius inputs."""
-    if value > 5000:
-        raise click.BadParameter(
-            f"""Your provided radius ({value}) is too large.
- The maximum is 5000."""
-        )
-    if value <= 0:
-        raise click.BadParameter(
-            f"""Your provided radius ({value}) is too small.
- The minimum is 0.1."""
-        )
 
-    return value
+def _check_bounds(
+    value: tuple[float, ...], bounds: tuple[tuple[str, int, int], ...]
+) -> None:
+    """Raise `click.BadParameter` for the first value outside of its
+    ``(name, lower, upper)`` entry in ``bounds``.
+    """
+    for (name, lower, upper), item in zip(bounds, value, strict=True):
+        if not lower <= item <= upper:
+            raise click.BadParameter(
+                f"Your provided {name} ({item}) is out of bounds. "
+                f"The range is {lower} to {upper}."
+            )
 
 
 def check_coords(
     ctx: click.Context, param: dict, value: tuple[float, float]
 ) -> tuple[float, float]:
     """Validate coords inputs."""
-    latitude, longitude = value
-    if latitude < -90.0 or latitude > 90.0:
-        raise click.BadParameter(
-            f"Your provided latitude ({latitude}) is out of bounds."
-            "The range is -90 to 90."
-        )
-
-    if longitude < -180.0 or longitude > 180.0:
-        raise click.BadParameter(
-            f"Your provided longitude ({longitude}) is out of bounds."
-            "The range is -180 to 180."
-        )
+    _check_bounds(value, COORDS_BOUNDS)
 
     return value
 
@@ -75,23 +71,13 @@ def check_magnitude_bounds(
     ctx: click.Context, param: dict, value: tuple[int, int]
 ) -> tuple[int, int]:
     """Validate magnitude bounds."""
-    lower, upper = value
-    if lower < 0 or lower > 10:
-        raise click.BadParameter(
-            f"Your provided minimum magnitude ({lower}) is "
-            "out of bounds. The range is 0 to 10."
-        )
-
-    if upper > 10 or upper < 0:
-        raise click.BadParameter(
-            f"Your provided maximum magnitude ({upper}) is "
-            "out of bounds. The range is 0 to 10."
-        )
+    _check_bounds(value, MAGNITUDE_BOUNDS)
 
+    lower, upper = value
     if lower > upper:
         raise click.BadParameter(
-            f"""Your provided minimum magnitude ({lower})
-cannot excede your provided maximum magnitude ({upper})."""
+            f"Your provided minimum magnitude ({lower}) cannot excede "
+            f"your provided maximum magnitude ({upper})."
         )
 
     return value
@@ -111,9 +97,8 @@ cannot excede your provided maximum magnitude ({upper})."""
     "--radius",
     help="radius of search from central coordinates in km.",
     default=DEFAULT_RADIUS,
-    type=int,
+    type=click.IntRange(1, 5000),
     show_default=True,
-    callback=check_radius,
 )
 @click.option(
     "-c",
@@ -141,7 +126,7 @@ cannot excede your provided maximum magnitude ({upper})."""
     help="Perform a trial run with no data being sent to Kafka.",
 )
 def usgs_earthquake_data(
-    duration: tuple[int, int],
+    duration: timedelta,
     radius: int,
     coords: tuple[float, float],
     magnitude_bounds: tuple[int, int],
@@ -151,21 +136,19 @@ def usgs_earthquake_data(
     to console. Optionally, also allows the user to post the
     queried data to kafka.
     """
-    days, hours = duration
-    total_duration = timedelta(days=days, hours=hours)
+    # Deferred so that --help and invalid arguments don't pay for importing
+    # libcomcat (and its numpy/pandas stack).
+    from sasquatchbackpack import sasquatch
+    from sasquatchbackpack.scripts import usgs
 
-    results = usgs.search_api(
-        total_duration,
-        radius,
-        coords,
-        magnitude_bounds,
-    )
+    config = usgs.USGSConfig(duration, radius, coords, magnitude_bounds)
+    source = usgs.USGSSource(config)
+    results = source.get_results()
 
-    if len(results) > 0:
+    if results:
         click.secho("SUCCESS!", fg="green")
         click.echo("------")
-        for result in results:
-            click.echo(result)
+        click.echo("\n".join(map(str, results)))
         click.echo("------")
     else:
         click.secho("SUCCESS! (kinda)", fg="yellow")
@@ -180,9 +163,6 @@ def usgs_earthquake_data(
 
     click.echo("Sending data...")
 
-    config = usgs.USGSConfig(total_duration, radius, coords, magnitude_bounds)
-    source = usgs.USGSSource(config)
-
     backpack_dispatcher = sasquatch.BackpackDispatcher(
         source, sasquatch.DispatcherConfig()
     )
@@ -5,6 +5,7 @@ __all__ = ["BackpackDispatcher", "DispatcherConfig", "DataSource"]
 import os
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
+from functools import lru_cache
 from string import Template
 
 import requests
@@ -12,6 +13,30 @@ import requests
 # Code yoinked from https://github.com/lsst-sqre/
 # sasquatch/blob/main/examples/RestProxyAPIExample.ipynb
 
+_cluster_ids: dict[str, str] = {}
+"""Kafka cluster IDs already fetched, keyed by REST proxy URL"""
+
+_JSON_HEADERS = {"content-type": "application/json"}
+"""Headers for the REST proxy v3 (cluster and topic management) API"""
+
+_RECORD_HEADERS = {
+    "Content-Type": "application/vnd.kafka.avro.v2+json",
+    "Accept": "application/vnd.kafka.v2+json",
+}
+"""Headers for posting Avro records through the REST proxy v2 API"""
+
+
+@lru_cache(maxsize=128)
+def _render_schema(schema: str, namespace: str, topic_name: str) -> str:
+    """Fill in the namespace and topic name placeholders of a source schema.
+
+    Cached, as every dispatcher for the same source and namespace renders
+    the exact same schema.
+    """
+    return Template(schema).substitute(
+        {"namespace": namespace, "topic_name": topic_name}
+    )
+
 
 class DataSource(ABC):
     """Base class for all relevant backpack data sources.
@@ -34,7 +59,7 @@ class DataSource(ABC):
         pass
 
 
-@dataclass
+@dataclass(slots=True)
 class DispatcherConfig:
     """Class containing relevant configuration information for the
     BackpackDispatcher.
@@ -51,11 +76,19 @@ class DispatcherConfig:
     """Number of topic partitions to create"""
     replication_factor: int = 3
     """Number of topic replicas to create"""
+    batch_size: int = 500
+    """Maximum number of records to send per REST proxy request"""
     namespace: str = field(
         default=os.getenv("BACKPACK_NAMESPACE", "lsst.backpack")
     )
     """Sasquatch namespace for the topic"""
 
+    def __post_init__(self) -> None:
+        if self.batch_size < 1:
+            raise ValueError(
+                f"batch_size must be at least 1, got {self.batch_size}"
+            )
+
 
 class BackpackDispatcher:
     """A class to send backpack data to kafka.
@@ -73,11 +106,15 @@ class BackpackDispatcher:
     def __init__(self, source: DataSource, config: DispatcherConfig) -> None:
         self.source = source
         self.config = config
-        self.schema = Template(source.load_schema()).substitute(
-            {
-                "namespace": self.config.namespace,
-                "topic_name": self.source.topic_name,
-            }
+        # Shared so the REST proxy connection is kept alive between calls
+        self.session = requests.Session()
+        self.schema = _render_schema(
+            source.load_schema(), self.config.namespace, source.topic_name
+        )
+        self.full_topic_name = f"{config.namespace}.{source.topic_name}"
+        self.clusters_url = f"{config.sasquatch_rest_proxy_url}/v3/clusters"
+        self.records_url = (
+            f"{config.sasquatch_rest_proxy_url}/topics/{self.full_topic_name}"
         )
 
     def create_topic(self) -> str:
@@ -88,34 +125,34 @@ class BackpackDispatcher:
         response text : str
             The results of the requests in string format
         """
-        headers = {"content-type": "application/json"}
-
-        try:
-            r = requests.get(
-                f"{self.config.sasquatch_rest_proxy_url}/v3/clusters",
-                headers=headers,
-                timeout=10,
-            )
-            r.raise_for_status()  # Raises HTTPError for bad responses
-            cluster_id = r.json()["data"][0]["cluster_id"]
-        except requests.RequestException as e:
-            return f"Error getting cluster ID: {e}"
+        # The cluster ID doesn't change for the lifetime of the process, so
+        # only ask the REST proxy for it once.
+        proxy_url = self.config.sasquatch_rest_proxy_url
+        cluster_id = _cluster_ids.get(proxy_url)
+        if cluster_id is None:
+            try:
+                r = self.session.get(
+                    self.clusters_url,
+                    headers=_JSON_HEADERS,
+                    timeout=10,
+                )
+                r.raise_for_status()  # Raises HTTPError for bad responses
+                cluster_id = r.json()["data"][0]["cluster_id"]
+            except requests.RequestException as e:
+                return f"Error getting cluster ID: {e}"
+            _cluster_ids[proxy_url] = cluster_id
 
         topic_config = {
-            "topic_name": f"{self.config.namespace}."
-            f"{self.source.topic_name}",
+            "topic_name": self.full_topic_name,
             "partitions_count": self.config.partitions_count,
             "replication_factor": self.config.replication_factor,
         }
 
-        headers = {"content-type": "application/json"}
-
         try:
-            response = requests.post(
-                f"{self.config.sasquatch_rest_proxy_url}/v3/clusters/"
-                f"{cluster_id}/topics",
+            response = self.session.post(
+                f"{self.clusters_url}/{cluster_id}/topics",
                 json=topic_config,
-                headers=headers,
+                headers=_JSON_HEADERS,
                 timeout=10,
             )
             response.raise_for_status()  # Raises HTTPError for bad responses
@@ -126,37 +163,41 @@ class BackpackDispatcher:
 
     def post(self) -> str:
         """Assemble schema and payload from the given source, then
-        makes a POST request to kafka.
+        makes POST requests to kafka, sending at most
+        ``config.batch_size`` records per request.
 
         Returns
         -------
         response text : str
-            The results of the POST request in string format
+            The results of the POST requests in string format, one line
+            per batch, or a warning if the source had no records to send
         """
         records = self.source.get_records()
+        if not records:
+            return "Warning: No records to post, skipping."
+
+        batch_size = self.config.batch_size
+        results = []
+        for start in range(0, len(records), batch_size):
+            payload = {
+                "value_schema": self.schema,
+                "records": records[start : start + batch_size],
+            }
 
-        payload = {"value_schema": self.schema, "records": records}
-
-        url = (
-            f"{self.config.sasquatch_rest_proxy_url}/topics/"
-            f"{self.config.namespace}.{self.source.topic_name}"
-        )
-
-        headers = {
-            "Content-Type": "application/vnd.kafka.avro.v2+json",
-            "Accept": "application/vnd.kafka.v2+json",
-        }
-
-        try:
-            response = requests.request(
-                "POST",
-                url,
-                json=payload,
-                headers=headers,
-                timeout=10,
-            )
-            response.raise_for_status()  # Raises HTTPError for bad responses
-        except requests.RequestException as e:
-            return f"Error POSTing data: {e}"
-
-        return response.text
+            try:
+                response = self.session.post(
+                    self.records_url,
+                    json=payload,
+                    headers=_RECORD_HEADERS,
+                    timeout=10,
+                )
+                response.raise_for_status()  # HTTPError for bad responses
+            except requests.RequestException as e:
+                return (
+                    f"Error POSTing data: {e} "
+                    f"({start} of {len(records)} records sent)"
+                )
+
+            results.append(response.text)
+
+        return "\n".join(results)
@@ -1,8 +1,16 @@
 """Accesses the USGSLibcomcat API."""
 
+import contextlib
+import hashlib
+import json
+import os
+import time
 from dataclasses import dataclass
-from datetime import datetime, timedelta
+from datetime import UTC, datetime, timedelta
+from functools import cache
+from pathlib import Path
 
+from libcomcat.classes import SummaryEvent
 from libcomcat.search import search
 
 from sasquatchbackpack.sasquatch import DataSource
@@ -10,6 +18,63 @@ from sasquatchbackpack.schemas.usgs import EarthquakeSchema
 
 __all__ = ["USGSSource", "USGSConfig"]
 
+CACHE_DIR = Path(
+    os.getenv(
+        "BACKPACK_CACHE_DIR", Path.home() / ".cache" / "sasquatchbackpack"
+    )
+)
+"""Directory holding cached USGS query results"""
+
+CACHE_TTL = timedelta(minutes=5)
+"""How long a cached USGS query result is reused for"""
+
+SEARCH_ATTEMPTS = 3
+"""How many times to try a USGS query before giving up"""
+
+SEARCH_LIMIT = 20000
+"""Maximum number of events the USGS API returns for a single request"""
+
+
+def _cache_path(
+    duration: timedelta,
+    radius: int,
+    coords: tuple[float, float],
+    magnitude_bounds: tuple[int, int],
+) -> Path:
+    """Get the cache file for a given set of query parameters."""
+    key = hashlib.blake2b(
+        repr((duration, radius, coords, magnitude_bounds)).encode(),
+        digest_size=8,
+    ).hexdigest()
+    return CACHE_DIR / f"usgs-{key}.json"
+
+
+def _read_cache(path: Path) -> list[SummaryEvent] | None:
+    """Load cached results, or None if they are missing, expired or
+    malformed.
+    """
+    try:
+        if time.time() - path.stat().st_mtime > CACHE_TTL.total_seconds():
+            return None
+        features = json.loads(path.read_text())
+    except (OSError, ValueError):
+        return None
+    if not isinstance(features, list) or not all(
+        isinstance(feature, dict) for feature in features
+    ):
+        return None
+    return [SummaryEvent(feature) for feature in features]
+
+
+def _write_cache(path: Path, results: list[SummaryEvent]) -> None:
+    """Store results, ignoring failures such as a read-only home."""
+    # SummaryEvent has no public accessor for the GeoJSON feature it wraps,
+    # and that feature is all that's needed to rebuild it.
+    features = [result._jdict for result in results]  # noqa: SLF001
+    with contextlib.suppress(OSError):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(features))
+
 
 def search_api(
     duration: timedelta,
@@ -19,6 +84,9 @@ def search_api(
 ) -> list:
     """Seaches USGS databases for relevant earthquake data.
 
+    Results are cached on disk in ``CACHE_DIR`` for ``CACHE_TTL``, so
+    repeating an identical query shortly afterwards skips the USGS API.
+
     Parameters
     ----------
         duration (datetime.timedelta): How far back from the present
@@ -34,19 +102,51 @@ def search_api(
         max_magnitude (int, optional): maximum earthquake magnitude.
             Defaults to 10.
     """
-    # Linting bypassed, as at the time of writing Libcomcat breaks if provided
-    # with a timezone-aware datetime object
-    current_dt = datetime.utcnow()  # noqa: DTZ003
-
-    return search(
-        starttime=current_dt - duration,
-        endtime=current_dt,
-        maxradiuskm=radius,
-        latitude=coords[0],
-        longitude=coords[1],
-        minmagnitude=magnitude_bounds[0],
-        maxmagnitude=magnitude_bounds[1],
-    )
+    path = _cache_path(duration, radius, coords, magnitude_bounds)
+    cached = _read_cache(path)
+    if cached is not None:
+        return cached
+
+    # At the time of writing Libcomcat breaks if provided with a
+    # timezone-aware datetime object, so drop the tzinfo.
+    current_dt = datetime.now(UTC).replace(tzinfo=None)
+
+    query = {
+        "starttime": current_dt - duration,
+        "endtime": current_dt,
+        "maxradiuskm": radius,
+        "latitude": coords[0],
+        "longitude": coords[1],
+        "minmagnitude": magnitude_bounds[0],
+        "maxmagnitude": magnitude_bounds[1],
+    }
+    # libcomcat already spaces out its requests, but reports any failed
+    # one (rate limiting included) as a ConnectionError without retrying
+    # it, so back off and try again before giving up.
+    single_request = True
+    for attempt in range(SEARCH_ATTEMPTS):
+        try:
+            if single_request:
+                # libcomcat sizes its time segments from worldwide earthquake
+                # rates and pauses between each one, which is far too
+                # cautious for a regional search. Ask for everything in one
+                # request, and only fall back to segmenting if that hit the
+                # search limit or failed, since a large response can time out
+                # where smaller segments don't. Retries go straight to the
+                # segmented search rather than repeating the big request.
+                single_request = False
+                with contextlib.suppress(ConnectionError):
+                    results = search(**query, enable_limit=True)
+                    if len(results) < SEARCH_LIMIT:
+                        break
+            results = search(**query)
+            break
+        except ConnectionError:
+            if attempt == SEARCH_ATTEMPTS - 1:
+                raise
+            time.sleep(2**attempt)
+    _write_cache(path, results)
+    return results
 
 
 @dataclass
@@ -82,6 +182,12 @@ class USGSConfig:
     topic_name: str = "usgs_earthquake_data"
 
 
+@cache
+def _earthquake_avro_schema() -> str:
+    """Generate the earthquake Avro schema, once per process."""
+    return EarthquakeSchema.avro_schema().replace("double", "float")
+
+
 class USGSSource(DataSource):
     """Backpack data source for the USGS Earthquake API.
 
@@ -101,17 +207,36 @@ class USGSSource(DataSource):
         super().__init__(config.topic_name)
         self.duration = config.duration
         self.config = config
-        self.schema = EarthquakeSchema.avro_schema().replace("double", "float")
         self.radius = config.radius
         self.coords = config.coords
         self.magnitude_bounds = config.magnitude_bounds
+        self._results: list[SummaryEvent] | None = None
+
+    def get_results(self) -> list[SummaryEvent]:
+        """Query the USGS Comcat API, once per source.
+
+        Returns
+        -------
+        list[SummaryEvent]
+            Earthquakes matching the source's configuration. Later calls
+            return the same list without querying again.
+        """
+        if self._results is None:
+            self._results = search_api(
+                self.duration,
+                self.radius,
+                self.coords,
+                self.magnitude_bounds,
+            )
+        return self._results
 
     def load_schema(self) -> str:
-        """Load the relevant schema."""
-        return self.schema
+        """Load the relevant schema, generating it on first use."""
+        return _earthquake_avro_schema()
 
     def get_records(self) -> list[dict]:
-        """Call the USGS Comcat API and assembles records.
+        """Assemble records from the source's USGS results, querying the
+        USGS Comcat API first if they haven't been fetched yet.
 
         Returns
         -------
@@ -121,17 +246,12 @@ class USGSSource(DataSource):
             in the build results.
         """
         try:
-            results = search_api(
-                self.duration,
-                self.radius,
-                self.coords,
-                self.magnitude_bounds,
-            )
+            results = self.get_results()
 
             return [
                 {
                     "value": {
-                        "timestamp": int(result.time.strftime("%s")),
+                        "timestamp": int(result.time.timestamp()),
                         "id": result.id,
                         "latitude": result.latitude,
                         "longitude": result.longitude,
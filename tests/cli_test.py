@@ -35,14 +35,14 @@ from sasquatchbackpack.commands import usgs
             5001,
             (-30.22573200864174, -70.73932987127506),
             (2, 10),
-            ["radius", "large"],
+            ["radius", "5001 is not in the range"],
         ),
         (
             (50, 0),
             0,
             (-30.22573200864174, -70.73932987127506),
             (2, 10),
-            ["radius", "small"],
+            ["radius", "0 is not in the range"],
         ),
         (
             (50, 0),
@@ -119,11 +119,10 @@ def test_usgs_earthquake_data(
     coords: tuple[float, float],
     magnitude_bounds: tuple[int, int],
     expected: list[str],
+    cli_runner: CliRunner,
 ) -> None:
     """Ensure fringe user input functions as intended."""
-    runner = CliRunner()
-
-    result = runner.invoke(
+    result = cli_runner.invoke(
         usgs.usgs_earthquake_data,
         [
             "-d",
@@ -141,5 +140,5 @@ def test_usgs_earthquake_data(
         input="N",
     )
 
-    for value in expected:
-        assert value in result.output
+    missing = [value for value in expected if value not in result.output]
+    assert not missing, result.output
@@ -1 +1,21 @@
 """Pytest configuration and fixtures."""
+
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from sasquatchbackpack.scripts import usgs
+
+
+@pytest.fixture(scope="session")
+def cli_runner() -> CliRunner:
+    """Click test runner shared by the CLI tests."""
+    return CliRunner()
+
+
+@pytest.fixture(autouse=True)
+def usgs_cache_dir(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> Path:
+    """Keep USGS query results out of the real user cache."""
+    monkeypatch.setattr(usgs, "CACHE_DIR", tmp_path)
+    return tmp_path
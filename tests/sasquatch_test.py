@@ -0,0 +1,158 @@
+"""Test the backpack dispatcher."""
+
+import json
+from collections.abc import Iterator
+from typing import Any
+
+import pytest
+import requests
+
+from sasquatchbackpack import sasquatch
+
+PROXY_URL = "https://proxy.example.com/sasquatch-rest-proxy"
+
+
+class StaticSource(sasquatch.DataSource):
+    """Data source returning a fixed list of records."""
+
+    def __init__(self, records: list[dict]) -> None:
+        super().__init__("static")
+        self.records = records
+
+    def load_schema(self) -> str:
+        return '{"namespace": "$namespace", "name": "$topic_name"}'
+
+    def get_records(self) -> list[dict]:
+        return self.records
+
+
+class FakeSession:
+    """Stand-in for requests.Session that replays canned responses."""
+
+    def __init__(self, responses: list[requests.Response]) -> None:
+        self.responses = responses
+        self.calls: list[tuple[str, str, dict[str, Any]]] = []
+
+    def get(self, url: str, **kwargs: Any) -> requests.Response:
+        return self._request("GET", url, kwargs)
+
+    def post(self, url: str, **kwargs: Any) -> requests.Response:
+        return self._request("POST", url, kwargs)
+
+    def _request(
+        self, method: str, url: str, kwargs: dict[str, Any]
+    ) -> requests.Response:
+        self.calls.append((method, url, kwargs))
+        return self.responses.pop(0)
+
+
+def make_response(status_code: int, body: Any) -> requests.Response:
+    """Build a REST proxy response with a JSON body."""
+    response = requests.Response()
+    response.status_code = status_code
+    response.url = PROXY_URL
+    response._content = json.dumps(body).encode()
+    return response
+
+
+def make_dispatcher(
+    monkeypatch: pytest.MonkeyPatch,
+    source: sasquatch.DataSource,
+    responses: list[requests.Response],
+    **config: Any,
+) -> tuple[sasquatch.BackpackDispatcher, FakeSession]:
+    """Create a dispatcher whose HTTP session replays ``responses``."""
+    dispatcher = sasquatch.BackpackDispatcher(
+        source,
+        sasquatch.DispatcherConfig(
+            sasquatch_rest_proxy_url=PROXY_URL, **config
+        ),
+    )
+    session = FakeSession(responses)
+    monkeypatch.setattr(dispatcher, "session", session)
+    return dispatcher, session
+
+
+@pytest.fixture(autouse=True)
+def _clear_cluster_ids() -> Iterator[None]:
+    """Stop cluster IDs cached by one test leaking into the next."""
+    sasquatch._cluster_ids.clear()
+    yield
+    sasquatch._cluster_ids.clear()
+
+
+def test_create_topic_caches_cluster_id(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Ensure the cluster ID is fetched once, and only once it succeeds."""
+    cluster = {"data": [{"cluster_id": "abc"}]}
+    dispatcher, session = make_dispatcher(
+        monkeypatch,
+        StaticSource([]),
+        [
+            make_response(500, {}),
+            make_response(200, cluster),
+            make_response(201, {"topic_name": "lsst.backpack.static"}),
+            make_response(201, {"topic_name": "lsst.backpack.static"}),
+        ],
+    )
+
+    assert dispatcher.create_topic().startswith("Error getting cluster ID")
+    dispatcher.create_topic()
+    dispatcher.create_topic()
+
+    assert [(method, url) for method, url, _ in session.calls] == [
+        ("GET", f"{PROXY_URL}/v3/clusters"),
+        ("GET", f"{PROXY_URL}/v3/clusters"),
+        ("POST", f"{PROXY_URL}/v3/clusters/abc/topics"),
+        ("POST", f"{PROXY_URL}/v3/clusters/abc/topics"),
+    ]
+
+
+def test_post_without_records(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Ensure an empty source sends nothing to the REST proxy."""
+    dispatcher, session = make_dispatcher(monkeypatch, StaticSource([]), [])
+
+    assert dispatcher.post() == "Warning: No records to post, skipping."
+    assert session.calls == []
+
+
+def test_post_batches(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Ensure records are split into batch_size sized requests."""
+    records = [{"value": {"id": str(i)}} for i in range(5)]
+    dispatcher, session = make_dispatcher(
+        monkeypatch,
+        StaticSource(records),
+        [make_response(200, {"batch": i}) for i in range(3)],
+        batch_size=2,
+    )
+
+    assert dispatcher.post() == '{"batch": 0}\n{"batch": 1}\n{"batch": 2}'
+    assert [kwargs["json"]["records"] for _, _, kwargs in session.calls] == [
+        records[0:2],
+        records[2:4],
+        records[4:5],
+    ]
+
+
+def test_post_batch_failure(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Ensure a failed batch stops posting and reports what was sent."""
+    records = [{"value": {"id": str(i)}} for i in range(5)]
+    dispatcher, session = make_dispatcher(
+        monkeypatch,
+        StaticSource(records),
+        [make_response(200, {}), make_response(500, {})],
+        batch_size=2,
+    )
+
+    result = dispatcher.post()
+
+    assert result.startswith("Error POSTing data: 500 Server Error")
+    assert result.endswith("(2 of 5 records sent)")
+    assert len(session.calls) == 2
+
+
+def test_batch_size_validation() -> None:
+    """Ensure batch sizes below one are rejected."""
+    with pytest.raises(ValueError, match="batch_size"):
+        sasquatch.DispatcherConfig(batch_size=0)
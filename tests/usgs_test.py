@@ -0,0 +1,210 @@
+"""Test the USGS script."""
+
+import time
+from collections.abc import Iterator
+from datetime import timedelta
+from pathlib import Path
+from typing import Any
+
+import pytest
+from libcomcat.classes import SummaryEvent
+
+from sasquatchbackpack.scripts import usgs
+
+FEATURE = {
+    "id": "us7000abcd",
+    "properties": {"time": 1726000000000, "mag": 4.2},
+    "geometry": {"coordinates": [-70.7, -30.2, 35.0]},
+}
+
+
+@pytest.fixture
+def search_calls(monkeypatch: pytest.MonkeyPatch) -> list[dict[str, Any]]:
+    """Stub out libcomcat, recording each search."""
+    calls: list[dict[str, Any]] = []
+
+    def fake_search(**kwargs: Any) -> list[SummaryEvent]:
+        calls.append(kwargs)
+        return [SummaryEvent(FEATURE)]
+
+    monkeypatch.setattr(usgs, "search", fake_search)
+    return calls
+
+
+def test_search_api_cache(search_calls: list[dict[str, Any]]) -> None:
+    """Ensure repeated identical queries are served from the cache."""
+    first = usgs.search_api(timedelta(days=1))
+    second = usgs.search_api(timedelta(days=1))
+
+    assert len(search_calls) == 1
+    assert [r.id for r in second] == [r.id for r in first]
+    assert second[0].magnitude == 4.2
+
+    usgs.search_api(timedelta(days=2))
+    assert len(search_calls) == 2
+
+
+def test_search_api_segments_when_limited(
+    search_calls: list[dict[str, Any]], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Ensure a truncated single-request search falls back to segments."""
+    usgs.search_api(timedelta(days=1))
+    assert search_calls[0]["enable_limit"] is True
+
+    monkeypatch.setattr(usgs, "CACHE_TTL", timedelta(seconds=-1))
+    monkeypatch.setattr(usgs, "SEARCH_LIMIT", 1)
+    usgs.search_api(timedelta(days=1))
+
+    assert len(search_calls) == 3
+    assert "enable_limit" not in search_calls[2]
+
+
+def test_search_api_cache_expiry(
+    search_calls: list[dict[str, Any]], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Ensure expired cache entries trigger a fresh query."""
+    monkeypatch.setattr(usgs, "CACHE_TTL", timedelta(seconds=-1))
+
+    usgs.search_api(timedelta(days=1))
+    usgs.search_api(timedelta(days=1))
+
+    assert len(search_calls) == 2
+
+
+@pytest.mark.parametrize("content", ["{}", '["feature"]', "not json"])
+def test_search_api_malformed_cache(
+    search_calls: list[dict[str, Any]], usgs_cache_dir: Path, content: str
+) -> None:
+    """Ensure unusable cache files are treated as a cache miss."""
+    usgs.search_api(timedelta(days=1))
+    (cache_file,) = usgs_cache_dir.iterdir()
+    cache_file.write_text(content)
+
+    results = usgs.search_api(timedelta(days=1))
+
+    assert [r.id for r in results] == ["us7000abcd"]
+    assert len(search_calls) == 2
+
+
+@pytest.fixture
+def local_timezone(monkeypatch: pytest.MonkeyPatch) -> Iterator[None]:
+    """Run the test with a non-UTC local timezone."""
+    with monkeypatch.context() as patch:
+        patch.setenv("TZ", "America/Santiago")
+        time.tzset()
+        yield
+    time.tzset()
+
+
+@pytest.mark.usefixtures("local_timezone")
+def test_get_records(search_calls: list[dict[str, Any]]) -> None:
+    """Ensure records are built from search results with UTC timestamps."""
+    config = usgs.USGSConfig(
+        timedelta(days=1),
+        400,
+        (-30.22573200864174, -70.73932987127506),
+        (2, 10),
+    )
+
+    records = usgs.USGSSource(config).get_records()
+
+    assert records == [
+        {
+            "value": {
+                "timestamp": 1726000000,
+                "id": "us7000abcd",
+                "latitude": -30.2,
+                "longitude": -70.7,
+                "depth": 35.0,
+                "magnitude": 4.2,
+            }
+        }
+    ]
+
+
+def test_search_api_falls_back_on_error(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Ensure a failed single-request search falls back to segments."""
+    sleeps: list[float] = []
+    search_calls: list[dict[str, Any]] = []
+
+    def timing_out_search(**kwargs: Any) -> list[SummaryEvent]:
+        search_calls.append(kwargs)
+        if kwargs.get("enable_limit"):
+            raise ConnectionError("timed out")
+        return [SummaryEvent(FEATURE)]
+
+    monkeypatch.setattr(usgs, "search", timing_out_search)
+    monkeypatch.setattr(time, "sleep", sleeps.append)
+
+    results = usgs.search_api(timedelta(days=1))
+
+    assert [r.id for r in results] == ["us7000abcd"]
+    assert [call.get("enable_limit") for call in search_calls] == [True, None]
+    assert sleeps == []
+
+
+def test_search_api_retry(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Ensure a failed USGS query is retried with backoff."""
+    sleeps: list[float] = []
+    search_calls: list[dict[str, Any]] = []
+    failures = iter([ConnectionError("rate limited")] * 2)
+
+    def flaky_search(**kwargs: Any) -> list[SummaryEvent]:
+        search_calls.append(kwargs)
+        for error in failures:
+            raise error
+        return [SummaryEvent(FEATURE)]
+
+    monkeypatch.setattr(usgs, "search", flaky_search)
+    monkeypatch.setattr(time, "sleep", sleeps.append)
+
+    results = usgs.search_api(timedelta(days=1))
+
+    assert [r.id for r in results] == ["us7000abcd"]
+    assert sleeps == [1]
+    # Only the first attempt uses the single request; retries segment.
+    assert [call.get("enable_limit") for call in search_calls] == [
+        True,
+        None,
+        None,
+    ]
+
+    monkeypatch.setattr(usgs, "CACHE_TTL", timedelta(seconds=-1))
+    failures = iter([ConnectionError("down")] * (usgs.SEARCH_ATTEMPTS + 1))
+    with pytest.raises(ConnectionError):
+        usgs.search_api(timedelta(days=1))
+
+
+def test_source_queries_once(search_calls: list[dict[str, Any]]) -> None:
+    """Ensure a source reuses its results when building records."""
+    config = usgs.USGSConfig(
+        timedelta(days=1),
+        400,
+        (-30.22573200864174, -70.73932987127506),
+        (2, 10),
+    )
+    source = usgs.USGSSource(config)
+
+    results = source.get_results()
+    source.get_records()
+
+    assert source.get_results() is results
+    assert len(search_calls) == 1
+
+
+def test_source_schema_is_lazy() -> None:
+    """Ensure creating a source doesn't generate the Avro schema."""
+    usgs._earthquake_avro_schema.cache_clear()
+    config = usgs.USGSConfig(
+        timedelta(days=1),
+        400,
+        (-30.22573200864174, -70.73932987127506),
+        (2, 10),
+    )
+
+    source = usgs.USGSSource(config)
+    assert usgs._earthquake_avro_schema.cache_info().currsize == 0
+
+    assert '"float"' in source.load_schema()